@@ -1,2 +1,34 @@
 SMS_NS = "https://ossm.dev/sms/0.5"
 NS = {"sms": SMS_NS}
+
+
+def _tag(local: str) -> str:
+    return f"{{{SMS_NS}}}{local}"
+
+
+# pre-built Clark-notation tags; avoids prefix resolution on every find call
+TAG_METADATA = _tag("metadata")
+TAG_NAME = _tag("name")
+TAG_VERSION = _tag("version")
+TAG_DATE = _tag("date")
+TAG_LICENSE = _tag("license")
+TAG_AUTHOR = _tag("author")
+TAG_KEYWORD = _tag("keyword")
+TAG_DESCRIPTION = _tag("description")
+TAG_SPECIES = _tag("species")
+TAG_TIME_BASE = _tag("time_base")
+TAG_MODULES = _tag("modules")
+TAG_MODULE = _tag("module")
+TAG_SENSOR = _tag("sensor")
+TAG_ACTUATOR = _tag("actuator")
+TAG_IO = _tag("io")
+TAG_PORT = _tag("port")
+TAG_SHAPE = _tag("shape")
+TAG_DIM = _tag("dim")
+TAG_CONNECTIONS = _tag("connections")
+TAG_CONNECTION = _tag("connection")
+TAG_OBSERVABLES = _tag("observables")
+TAG_OBSERVABLE = _tag("observable")
+TAG_PORT_GROUPS = _tag("port_groups")
+TAG_PORT_GROUP = _tag("port_group")
+TAG_MEMBER = _tag("member")
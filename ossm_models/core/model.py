@@ -1,6 +1,10 @@
 """ Model class following the OSSM standards v0.4."""
+import functools
 import os.path
-import xml.etree.ElementTree as ET
+import pickle
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
 from typing import Dict
 from typing import List
 from typing import Optional
@@ -8,9 +12,14 @@ from typing import Tuple
 
 import networkx as nx
 import ossm_base as base
+from lxml import etree
 from ossm_base.model import OSSMModel
 
-from ossm_models.core.configs import NS
+from ossm_models.core.configs import (
+    TAG_ACTUATOR, TAG_CONNECTION, TAG_CONNECTIONS, TAG_METADATA, TAG_MODULE,
+    TAG_MODULES, TAG_OBSERVABLE, TAG_OBSERVABLES, TAG_SENSOR, TAG_SPECIES,
+    TAG_TIME_BASE
+)
 from ossm_models.core.parsers import _parse_connection
 from ossm_models.core.parsers import _parse_metadata
 from ossm_models.core.parsers import _parse_module
@@ -27,8 +36,12 @@ from ossm_models.core.sms_types import Port
 from ossm_models.core.sms_types import PortGroup
 from ossm_models.core.sms_types import Sensor
 from ossm_models.core.sms_types import Species
+from ossm_models.validation import compiled_schema
 from ossm_models.validation import ports_compatible
-from ossm_models.validation import validate_with_xsd
+
+_XSD_PATH = os.path.realpath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "SMS.xsd")
+)
 
 
 class SMSModel(OSSMModel):
@@ -55,15 +68,46 @@ class SMSModel(OSSMModel):
         self.observables = observables
         self.port_groups = port_groups
 
-        # indices
-        self.module_by_id: Dict[str, ModuleCore] = {m.id: m for m in self.module_types}
+        # indices, built in a single pass over the modules; duplicates are
+        # detected from dict growth so each port costs one hash insert
+        self.module_by_id: Dict[str, ModuleCore] = {}
         self.port_by_id: Dict[str, Port] = {}
+        self._ports_by_dir: Dict[str, Tuple[List[Port], List[Port]]] = {}
 
+        port_by_id = self.port_by_id
+        n_ports = 0
         for m in self.module_types:
+            self.module_by_id[m.id] = m
+            in_ports: List[Port] = []
+            out_ports: List[Port] = []
             for p in m.ports:
-                if p.id in self.port_by_id:
+                port_by_id[p.id] = p
+                n_ports += 1
+                if len(port_by_id) != n_ports:
                     raise ValueError(f"duplicate port id: {p.id}")
-                self.port_by_id[p.id] = p
+                if p.dir == "in":
+                    in_ports.append(p)
+                elif p.dir == "out":
+                    out_ports.append(p)
+            self._ports_by_dir[m.id] = (in_ports, out_ports)
+
+        # contiguous integer ids for graph construction: int hashing is much
+        # cheaper than string hashing inside NetworkX's nested dicts
+        self._port_int_to_id: List[str] = list(port_by_id)
+        self._port_index: Dict[str, int] = {
+            pid: i for i, pid in enumerate(self._port_int_to_id)
+        }
+
+        # resolve port-group members to Port objects once, so lookups do not
+        # have to go through port_by_id per member afterwards
+        for g in self.port_groups.values():
+            try:
+                g.resolved_members = tuple(port_by_id[pid] for pid in g.members)
+            except KeyError as e:
+                raise ValueError(f"port group '{g.id}' references unknown port id: {e.args[0]}")
+
+        # build_graphs cache; model data is treated as immutable after init
+        self._graphs: Optional[Tuple[nx.MultiDiGraph, nx.DiGraph]] = None
 
     @property
     def n_modules(self) -> int:
@@ -74,120 +118,231 @@ class SMSModel(OSSMModel):
         return self.modules + self.sensors + self.actuators
 
     @classmethod
-    def from_xml(cls, xml_path: str) -> "SMSModel":
-        validate_with_xsd(
-            xml_path,
-            os.path.join(
-                os.path.dirname(os.path.realpath(__file__)),
-                "../../SMS.xsd"
-            )
-        )
-
-        root = ET.parse(xml_path).getroot()
-        md = _parse_metadata(root.find("sms:metadata", NS))
-        species = _parse_species(root.find("sms:species", NS))
-        tb = root.find("sms:time_base", NS)
+    def from_xml(cls, xml_path: str, cache: bool = False) -> "SMSModel":
+        """ Load a model from an SMS XML file.
+
+        With `cache=True`, a pickle of the fully built model is kept next
+        to the XML (`<xml_path>.pkl`) and reused on subsequent loads as
+        long as the XML's mtime and size are unchanged, skipping XML
+        parsing, XSD validation and index building entirely.
+        """
+        if cache:
+            cache_path = xml_path + ".pkl"
+            st = os.stat(xml_path)
+            cache_key = (st.st_mtime_ns, st.st_size)
+            if os.path.exists(cache_path):
+                try:
+                    with open(cache_path, "rb") as f:
+                        stored_key, model = pickle.load(f)
+                    if stored_key == cache_key and isinstance(model, cls):
+                        return model
+                except Exception:
+                    pass  # stale or corrupt cache; fall through to parsing
+
+        # a schema-aware parser validates and parses in a single C-level pass;
+        # compiling the XSD is the expensive part, so it is cached across calls
+        parser = etree.XMLParser(schema=compiled_schema(_XSD_PATH))
+
+        root = etree.parse(xml_path, parser).getroot()
+        md = _parse_metadata(root.find(TAG_METADATA))
+        species = _parse_species(root.find(TAG_SPECIES))
+        tb = root.find(TAG_TIME_BASE)
         time_base_dt_ms = float(tb.get("dt_ms")) if (tb is not None and tb.get("dt_ms")) else None
 
-        modules = [_parse_module(e) for e in root.findall("sms:modules/sms:module", NS)]
-        sensors = [_parse_module(e) for e in root.findall("sms:modules/sms:sensor", NS)]
-        actuators = [_parse_module(e) for e in root.findall("sms:modules/sms:actuator", NS)]
+        # one pass over <modules> instead of three findall sweeps
+        modules: List[Module] = []
+        sensors: List[Sensor] = []
+        actuators: List[Actuator] = []
+        buckets = {
+            TAG_MODULE: modules,
+            TAG_SENSOR: sensors,
+            TAG_ACTUATOR: actuators,
+        }
+        mods_node = root.find(TAG_MODULES)
+        if mods_node is not None:
+            for e in mods_node:
+                bucket = buckets.get(e.tag)
+                if bucket is not None:
+                    bucket.append(_parse_module(e))
 
         connections = []
-        conns_node = root.find("sms:connections", NS)
+        conns_node = root.find(TAG_CONNECTIONS)
         if conns_node is not None:
-            connections = [_parse_connection(c) for c in conns_node.findall("sms:connection", NS)]
+            connections = [_parse_connection(c) for c in conns_node.findall(TAG_CONNECTION)]
         observables = []
-        obs_node = root.find("sms:observables", NS)
+        obs_node = root.find(TAG_OBSERVABLES)
         if obs_node is not None:
-            observables = [_parse_observable(o) for o in obs_node.findall("sms:observable", NS)]
+            observables = [_parse_observable(o) for o in obs_node.findall(TAG_OBSERVABLE)]
         port_groups = _parse_port_groups(root)
 
         model = cls(md, species, time_base_dt_ms, modules, sensors, actuators, connections, observables, port_groups)
 
+        if cache:
+            with open(cache_path, "wb") as f:
+                pickle.dump((cache_key, model), f, protocol=pickle.HIGHEST_PROTOCOL)
+
         return model
 
+    @classmethod
+    def from_xml_many(
+        cls,
+        xml_paths: List[str],
+        workers: Optional[int] = None,
+        cache: bool = False,
+    ) -> List["SMSModel"]:
+        """ Load many SMS XML files in parallel across a process pool.
+
+        Parsing and index building are independent per file, so the load
+        scales with core count; each worker compiles the XSD once (it is
+        cached at module level). Results are returned in input order.
+        """
+        if not xml_paths:
+            return []
+
+        workers = min(workers or os.cpu_count() or 1, len(xml_paths))
+        loader = functools.partial(cls.from_xml, cache=cache)
+        if workers == 1:
+            return [loader(p) for p in xml_paths]
+
+        chunksize = max(1, len(xml_paths) // workers)
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            return list(ex.map(loader, xml_paths, chunksize=chunksize))
+
     def resolve_connection_ports(self, c: Connection) -> Tuple[Port, Port]:
         """ Return (from_port, to_port) for a connection. """
         return self.port_by_id[c.from_id], self.port_by_id[c.to_id]
 
     def build_graphs(self) -> tuple[nx.MultiDiGraph, nx.DiGraph]:
-        """ Build and return the port graph and module graph. """
+        """ Build and return the port graph and module graph.
+
+        Port-graph nodes are contiguous integers (see `_port_index` /
+        `_port_int_to_id`); the original port id is kept as the node
+        attribute ``id``. The graphs are built once and cached; repeated
+        calls return the cached pair.
+        """
+        if self._graphs is not None:
+            return self._graphs
 
         port_g = nx.MultiDiGraph(name="sms_port_graph")
         mod_g = nx.DiGraph(name="sms_module_graph")
 
+        # accumulate nodes and edges over all modules and insert in bulk at
+        # the end, so NetworkX sees a handful of batched calls instead of
+        # one call per node/edge
+        mod_nodes = []
+        port_nodes = []
+        internal_edges: List[Tuple[int, int]] = []
+        port_index = self._port_index  # local binding for the hot loops
+
         for m in self.module_types:
-            if isinstance(m, Sensor):
-                mod_g.add_node(m.id, dt_ms=m.dt_ms, organ=m.organ.id if m.organ else None)
-            elif isinstance(m, Actuator):
-                mod_g.add_node(m.id, dt_ms=m.dt_ms, body_part=m.body_part.id if m.body_part else None)
-            elif isinstance(m, Module):
-                mod_g.add_node(m.id, dt_ms=m.dt_ms, region=m.region if m.region else None)
-            else:
-                raise NotImplementedError(m.id)
+            mod_nodes.append((m.id, {"dt_ms": m.dt_ms, **m.graph_node_attrs()}))
 
             for p in m.ports:
                 # flatten shape for attributes
                 shape_spec = p.shape.spec if p.shape else None
                 dims = [(d.name, d.size) for d in (p.shape.dims if p.shape else [])]
-                port_g.add_node(
-                    p.id,
-                    module=m.id, name=p.name, dir=p.dir, dtype=p.dtype,
-                    shape_spec=shape_spec, shape_dims=dims
-                )
-
-            # add implicit internal connections from input to output ports
-            in_ports = [p for p in m.ports if p.dir == "in"]
-            out_ports = [p for p in m.ports if p.dir == "out"]
-
-            for ip in in_ports:
-                for op in out_ports:
-                    port_g.add_edge(ip.id, op.id, kind="internal")
+                port_nodes.append((port_index[p.id], {
+                    "id": p.id,
+                    "module": m.id, "name": p.name, "dir": p.dir, "dtype": p.dtype,
+                    "shape_spec": shape_spec, "shape_dims": dims,
+                }))
+
+            # implicit internal connections from input to output ports,
+            # using the direction split precomputed in __init__
+            in_ports, out_ports = self._ports_by_dir[m.id]
+            internal_edges.extend(
+                (port_index[ip.id], port_index[op.id])
+                for ip, op in product(in_ports, out_ports)
+            )
 
+        connection_edges = []
+        port_pairs_by_edge: Dict[Tuple[str, str], List[Tuple[str, str]]] = defaultdict(list)
+        port_by_id = self.port_by_id  # local binding for the hot loop
         for c in self.connections:
-            sp, dp = self.resolve_connection_ports(c)
-            port_g.add_edge(sp.id, dp.id, kind="connection",
-                            delay_ms=c.delay_ms,
-                            from_id=c.from_id, to_id=c.to_id)
-
-            # add/aggregate module edges
-            if not mod_g.has_edge(sp.module_id, dp.module_id):
-                mod_g.add_edge(sp.module_id, dp.module_id, kind="connection")
-
-            # aggregate port pairs on module edges
-            me = mod_g.edges[sp.module_id, dp.module_id]
-            if "port_pairs" not in me:
-                me["port_pairs"] = []
-
-            me["port_pairs"].append((sp.id, dp.id))
+            sp = port_by_id[c.from_id]
+            dp = port_by_id[c.to_id]
+            connection_edges.append((port_index[sp.id], port_index[dp.id], {
+                "kind": "connection", "delay_ms": c.delay_ms,
+                "from_id": c.from_id, "to_id": c.to_id,
+            }))
+            # aggregate port pairs per module edge
+            port_pairs_by_edge[(sp.module_id, dp.module_id)].append((sp.id, dp.id))
+
+        mod_g.add_nodes_from(mod_nodes)
+        mod_g.add_edges_from(
+            (u, v, {"kind": "connection", "port_pairs": pairs})
+            for (u, v), pairs in port_pairs_by_edge.items()
+        )
+        port_g.add_nodes_from(port_nodes)
+        port_g.add_edges_from(internal_edges, kind="internal")
+        port_g.add_edges_from(connection_edges)
 
-        return port_g, mod_g
+        self._graphs = (port_g, mod_g)
+        return self._graphs
 
     def check_connections_compatibility(self) -> List[Tuple[str, str]]:
         """ Check all connections for port compatibility. """
 
         mismatches: List[Tuple[str, str]] = []
+        port_by_id = self.port_by_id  # local binding for the hot loop
         for c in self.connections:
-            sp, dp = self.resolve_connection_ports(c)
+            sp = port_by_id[c.from_id]
+            dp = port_by_id[c.to_id]
+            # fast path: equal (dtype, axes, dims) signatures are always
+            # compatible, so most connections in a valid model never enter
+            # ports_compatible
+            if sp._sig == dp._sig:
+                continue
             if not ports_compatible(sp, dp):
                 mismatches.append((sp.id, dp.id))
         return mismatches
 
+    def check_dt_consistency(self, rel_tol: float = 1e-9) -> List[str]:
+        """ Check module and observable rates against the time base.
+
+        Returns the ids of modules/observables whose dt_ms is not a
+        positive integer multiple of time_base_dt_ms. Items without a
+        dt_ms of their own are skipped; without a declared time base
+        there is nothing to check.
+        """
+        base = self.time_base_dt_ms
+        if not base:
+            return []
+
+        offenders: List[str] = []
+        for item in self.module_types + self.observables:
+            dt = item.dt_ms
+            if dt is None:
+                continue
+            ratio = dt / base
+            if dt <= 0 or round(ratio) < 1 or abs(ratio - round(ratio)) > rel_tol:
+                offenders.append(item.id)
+        return offenders
+
     # VISUALIZATION
 
-    def viz_model_graph(self):
-        """ Visualize the port graph using matplotlib. """
+    def viz_model_graph(self, port_g: Optional[nx.MultiDiGraph] = None, mod_g: Optional[nx.DiGraph] = None):
+        """ Visualize the port graph using matplotlib.
+
+        Pre-built graphs can be passed in; otherwise the (cached) result of
+        `build_graphs` is used.
+        """
         try:
             import matplotlib.pyplot as plt
         except ImportError:
             raise ImportError("matplotlib is required for visualization")
 
-        port_g, mod_g = self.build_graphs()
+        if port_g is None or mod_g is None:
+            port_g, mod_g = self.build_graphs()
 
         plt.figure(figsize=(12, 10))
 
-        pos = nx.spring_layout(port_g, seed=42)
+        # spring layout is O(n^2) per iteration and dominates wall time on
+        # big graphs; fall back to the cheaper Kamada-Kawai layout there
+        if port_g.number_of_nodes() > 500:
+            pos = nx.kamada_kawai_layout(port_g)
+        else:
+            pos = nx.spring_layout(port_g, seed=42)
 
         node_colors = []
         for n, d in port_g.nodes(data=True):
@@ -213,7 +368,8 @@ class SMSModel(OSSMModel):
 
         nx.draw_networkx_nodes(port_g, pos, nodelist=port_g.nodes(), node_color=node_colors, node_size=2500)
         nx.draw_networkx_edges(port_g, pos, edgelist=port_g.edges(), edge_color=edge_colors, arrows=True)
-        nx.draw_networkx_labels(port_g, pos, font_size=8)
+        labels = {i: self._port_int_to_id[i] for i in port_g.nodes}
+        nx.draw_networkx_labels(port_g, pos, labels=labels, font_size=8)
 
         plt.show()
 
@@ -239,14 +395,15 @@ if __name__ == "__main__":
     print(f"ports:   {port_g.number_of_nodes()} connections: "
           f"{sum(1 for _,_,d in port_g.edges(data=True) if d.get('kind')=='connection')}")
 
-    # visualize port graph
-    model.viz_model_graph()
+    # visualize port graph (reusing the graphs built above)
+    model.viz_model_graph(port_g, mod_g)
 
     mismatches = model.check_connections_compatibility()
     if mismatches:
         print("incompatible connections:")
         for u, v in mismatches:
-            pu, pv = port_g.nodes[u], port_g.nodes[v]
+            pu = port_g.nodes[model._port_index[u]]
+            pv = port_g.nodes[model._port_index[v]]
             print(f" - {pu['module']}.{pu['name']} -> {pv['module']}.{pv['name']}")
     else:
         print("all connections compatible")
@@ -2,10 +2,15 @@ import functools
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
-from xml.etree import ElementTree as ET
 
-from ossm_models.core.configs import NS
+from lxml import etree as ET
+
+from ossm_models.core.configs import (
+    SMS_NS, TAG_DIM, TAG_IO, TAG_MEMBER, TAG_PORT, TAG_PORT_GROUP,
+    TAG_PORT_GROUPS, TAG_SHAPE, TAG_SPECIES
+)
 from ossm_models.core.sms_types import Actuator
 
 from ossm_models.core.sms_types import (
@@ -15,103 +20,114 @@ from ossm_models.core.sms_types import (
 from ossm_models.core.sms_types import Sensor
 
 
-def _parse_port_groups(root: ET.Element) -> Dict[str, PortGroup]:
+def _parse_port_groups(root: ET._Element) -> Dict[str, PortGroup]:
     out: Dict[str, PortGroup] = {}
-    pg = root.find("sms:port_groups", NS)
+    pg = root.find(TAG_PORT_GROUPS)
     if pg is None:
         return out
-    for g in pg.findall("sms:port_group", NS):
+    for g in pg.findall(TAG_PORT_GROUP):
         gid = g.get("id")
-        members = [m.get("ref") for m in g.findall("sms:member", NS)]
+        members = tuple(m.get("ref") for m in g.iterfind(TAG_MEMBER))
         out[gid] = PortGroup(id=gid, members=members)
     return out
 
 
-def _parse_observable(e: ET.Element) -> Observable:
-    rate = e.get("dt_ms")
+def _parse_observable(e: ET._Element) -> Observable:
+    a = e.attrib
+    rate = a.get("dt_ms")
     return Observable(
-        id=e.get("id"),
-        source_module=e.get("source_module"),
-        source=e.get("source"),
+        id=a.get("id"),
+        source_module=a.get("source_module"),
+        source=a.get("source"),
         dt_ms=None if rate is None else float(rate),
     )
 
 
-def _parse_connection(e: ET.Element) -> Connection:
-    delay = e.get("delay_ms")
+def _parse_connection(e: ET._Element) -> Connection:
+    a = e.attrib
+    delay = a.get("delay_ms")
 
     return Connection(
-        from_id=e.get("from"),
-        to_id=e.get("to"),
+        from_id=a.get("from"),
+        to_id=a.get("to"),
         delay_ms=None if delay is None else float(delay),
     )
 
 
-def _parse_module(e: ET.Element) -> Union[Module, Sensor, Actuator]:
+def _parse_module(e: ET._Element) -> Union[Module, Sensor, Actuator]:
     mtype = {"sensor": Sensor,
              "actuator": Actuator,
              "module": Module}.get(e.tag.split("}")[1], Module)
 
-    io = e.find("sms:io", NS)
-    module_id = e.get("id")
-    ports: List[Port] = []
+    a = e.attrib
+    io = e.find(TAG_IO)
+    module_id = a.get("id")
+    ports: Tuple[Port, ...] = ()
     if io is not None:
-        ports = [_parse_port(p, module_id) for p in io.findall("sms:port", NS)]
-    dt = e.get("dt_ms")
+        ports = tuple(_parse_port(p, module_id) for p in io.findall(TAG_PORT))
+    dt = a.get("dt_ms")
 
     if mtype is Sensor:
-        region_like = {"organ": e.get("organ")}
+        region_like = {"organ": a.get("organ")}
     elif mtype is Actuator:
-        region_like = {"body_part": e.get("bodypart")}
+        region_like = {"body_part": a.get("bodypart")}
     else:
-        region_like = {"region": e.get("region")}
+        region_like = {"region": a.get("region")}
 
     return mtype(
         id=module_id,
         dt_ms=None if dt is None else float(dt),
-        species=_parse_species(e.find("sms:species", NS)),
+        species=_parse_species(e.find(TAG_SPECIES)),
         ports=ports,
         **region_like,
     )
 
 
-def _parse_port(e: ET.Element, module_id) -> Port:
-    rate = e.get("rate_hz")
+def _parse_port(e: ET._Element, module_id) -> Port:
+    a = e.attrib
     return Port(
-        id=e.get("id"),
-        name=e.get("name"),
-        dir=e.get("dir"),
-        dtype=e.get("dtype"),
-        shape=_parse_shape(e.find("sms:shape", NS)),
+        id=a.get("id"),
+        name=a.get("name"),
+        dir=a.get("dir"),
+        dtype=a.get("dtype"),
+        shape=_parse_shape(e.find(TAG_SHAPE)),
         module_id=module_id,
     )
 
 
-def _parse_shape(e: Optional[ET.Element]) -> Optional[Shape]:
+def _parse_shape(e: Optional[ET._Element]) -> Optional[Shape]:
     if e is None:
         return None
     dims: List[Dim] = []
-    for d in e.findall("sms:dim", NS):
-        size = d.get("size")
-        dims.append(Dim(name=d.get("name"), size=None if size is None else int(size)))
-    return Shape(spec=e.get("spec"), dims=dims)
+    for d in e.findall(TAG_DIM):
+        a = d.attrib
+        size = a.get("size")
+        dims.append(Dim.intern(a.get("name"), None if size is None else int(size)))
+    return Shape.intern(e.get("spec"), tuple(dims))
 
 
-def _parse_species(e: Optional[ET.Element]) -> Optional[Species]:
+def _parse_species(e: Optional[ET._Element]) -> Optional[Species]:
     if e is None:
         return None
-    return Species(e.get("name"), e.get("ncbi_taxid"), e.get("scope"))
-
-
-def _parse_metadata(e: ET.Element) -> Metadata:
-    def texts(tag: str) -> List[str]:
-        return [x.text for x in e.findall(f"sms:{tag}", NS) if x.text]
-    return Metadata(
-        name=e.findtext("sms:name", default="", namespaces=NS),
-        version=e.findtext("sms:version", default="", namespaces=NS),
-        date=e.findtext("sms:date", default="", namespaces=NS),
-        license=e.findtext("sms:license", default="", namespaces=NS),
-        author=texts("author"),
-        keyword=texts("keyword"),
-        description=e.findtext("sms:description", default=None, namespaces=NS),
-    )
+    a = e.attrib
+    return Species(a.get("name"), a.get("ncbi_taxid"), a.get("scope"))
+
+
+def _parse_metadata(e: ET._Element) -> Metadata:
+    # one pass over the children instead of a findtext/findall scan per field
+    fields = {"name": "", "version": "", "date": "", "license": "", "description": None}
+    authors: List[str] = []
+    keywords: List[str] = []
+    prefix_len = len(SMS_NS) + 2  # strip the "{ns}" wrapper from tags
+    for child in e:
+        tag = child.tag
+        if not isinstance(tag, str):  # comments and processing instructions
+            continue
+        local = tag[prefix_len:]
+        if local in fields:
+            fields[local] = child.text or ""
+        elif local == "author" and child.text:
+            authors.append(child.text)
+        elif local == "keyword" and child.text:
+            keywords.append(child.text)
+    return Metadata(**fields, author=tuple(authors), keyword=tuple(keywords))
@@ -2,39 +2,71 @@
 from __future__ import annotations
 
 import abc
+import sys
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Tuple
+from weakref import WeakValueDictionary
 
 import ossm_base as base
 
 
-@dataclass
+@dataclass(slots=True)
 class Metadata:
     name: str
     version: str
     date: str
     license: str
-    author: List[str] = field(default_factory=list)
-    keyword: List[str] = field(default_factory=list)
+    author: Tuple[str, ...] = ()
+    keyword: Tuple[str, ...] = ()
     description: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class Species:
     name: str
     ncbi_taxid: Optional[str] = None
     scope: Optional[str] = None
 
-@dataclass
+# flyweight registries: many ports share identical dims/shapes, so the
+# parsers intern them and compatibility checks can short-circuit on identity
+_DIM_CACHE: "WeakValueDictionary[Tuple[Optional[str], Optional[int]], Dim]" = WeakValueDictionary()
+_SHAPE_CACHE: "WeakValueDictionary[tuple, Shape]" = WeakValueDictionary()
+
+
+@dataclass(slots=True, weakref_slot=True)
 class Dim:
     name: Optional[str]
     size: Optional[int]  # -1 for wildcard, None unknown
 
-@dataclass
+    def __post_init__(self):
+        # axis names come from a small vocabulary; interning makes the
+        # equality checks in validation pointer compares
+        if self.name:
+            self.name = sys.intern(self.name)
+
+    @classmethod
+    def intern(cls, name: Optional[str], size: Optional[int]) -> "Dim":
+        """ Canonical shared instance for (name, size). """
+        key = (name, size)
+        d = _DIM_CACHE.get(key)
+        if d is None:
+            d = _DIM_CACHE[key] = cls(name=name, size=size)
+        return d
+
+@dataclass(slots=True, weakref_slot=True)
 class Shape:
     spec: Optional[str]
-    dims: List[Dim] = field(default_factory=list)
-
-@dataclass
+    dims: Tuple[Dim, ...] = ()
+
+    @classmethod
+    def intern(cls, spec: Optional[str], dims: Tuple[Dim, ...] = ()) -> "Shape":
+        """ Canonical shared instance for (spec, dims). """
+        key = (spec, tuple((d.name, d.size) for d in dims))
+        s = _SHAPE_CACHE.get(key)
+        if s is None:
+            s = _SHAPE_CACHE[key] = cls(spec=spec, dims=dims)
+        return s
+
+@dataclass(slots=True)
 class Port:
     id: str
     name: str
@@ -42,56 +74,119 @@ class Port:
     dtype: str
     shape: Optional[Shape] = None
     module_id: Optional[str] = None
-
-@dataclass
+    # parsed shape views, filled eagerly below; read through
+    # validation.port_axes / validation.port_dims_map (an absent spec is
+    # stored as the empty tuple)
+    _axes: Optional[Tuple[str, ...]] = field(default=None, init=False, repr=False, compare=False)
+    _dims_map: Optional[Dict[str, Optional[int]]] = field(default=None, init=False, repr=False, compare=False)
+    # hashable compatibility signature: two ports with equal signatures are
+    # always compatible, so hot loops can prefilter on it
+    _sig: Optional[Tuple] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # dtype and dir are drawn from the small XSD enumerations; interned
+        # strings compare by pointer in ports_compatible
+        if self.dtype:
+            self.dtype = sys.intern(self.dtype)
+        if self.dir:
+            self.dir = sys.intern(self.dir)
+
+        # parse the shape spec once at construction so validation never
+        # touches the spec string again
+        shape = self.shape
+        spec = shape.spec if shape else None
+        self._axes = tuple(a.strip() for a in spec.split(",") if a.strip()) if spec else ()
+        dims: Dict[str, Optional[int]] = {}
+        if shape:
+            for d in shape.dims:
+                if d.name:
+                    dims[d.name] = d.size
+        self._dims_map = dims
+        self._sig = (self.dtype, self._axes, frozenset(dims.items()))
+
+@dataclass(slots=True)
 class Region:
     id: str
     name: Optional[str] = None
     atlas: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class Organ:
     id: str
     name: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class BodyPart:
     id: str
     name: Optional[str] = None
 
-@dataclass
 class ModuleCore(abc.ABC):
+    """ Common interface of Module, Sensor and Actuator.
+
+    Carries no fields itself: the concrete classes declare their full,
+    flat field list so the dataclass machinery generates a single plain
+    __init__ per class instead of chaining through the base.
+    """
+    __slots__ = ()
+
     id: str
-    dt_ms: Optional[float] = None
-    species: Optional[Species] = None
-    ports: List[Port] = field(default_factory=list)
+    dt_ms: Optional[float]
+    species: Optional[Species]
+    ports: Tuple[Port, ...]
+
+    @abc.abstractmethod
+    def graph_node_attrs(self) -> Dict:
+        """ Kind-specific node attributes for the module graph. """
 
-@dataclass
+@dataclass(slots=True)
 class Module(ModuleCore):
+    id: str
+    dt_ms: Optional[float] = None
+    species: Optional[Species] = None
+    ports: Tuple[Port, ...] = ()
     region: Optional[Region] = None
 
-@dataclass
+    def graph_node_attrs(self) -> Dict:
+        return {"region": self.region if self.region else None}
+
+@dataclass(slots=True)
 class Sensor(ModuleCore):
+    id: str
+    dt_ms: Optional[float] = None
+    species: Optional[Species] = None
+    ports: Tuple[Port, ...] = ()
     organ: Optional[Organ] = None
 
-@dataclass
+    def graph_node_attrs(self) -> Dict:
+        return {"organ": self.organ.id if self.organ else None}
+
+@dataclass(slots=True)
 class Actuator(ModuleCore):
+    id: str
+    dt_ms: Optional[float] = None
+    species: Optional[Species] = None
+    ports: Tuple[Port, ...] = ()
     body_part: Optional[BodyPart] = None
 
-@dataclass
+    def graph_node_attrs(self) -> Dict:
+        return {"body_part": self.body_part.id if self.body_part else None}
+
+@dataclass(slots=True)
 class Connection:
     from_id: str  # port id
     to_id: str    # port id
     delay_ms: Optional[float] = None
 
-@dataclass(kw_only=True)
+@dataclass(slots=True, kw_only=True)
 class Observable(base.types.Observable):
     id: str
     source_module: str
     source: str
     dt_ms: Optional[float] = None
 
-@dataclass
+@dataclass(slots=True)
 class PortGroup:
     id: str
-    members: List[str]  # list of port IDs
+    members: Tuple[str, ...]  # port IDs
+    # member ids resolved to Port objects; filled by SMSModel.__init__
+    resolved_members: Tuple[Port, ...] = field(default=(), init=False, repr=False, compare=False)
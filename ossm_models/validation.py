@@ -1,16 +1,68 @@
 # sms_validators.py
 from __future__ import annotations
-from typing import Iterable, List, Dict, Optional
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Dict, Optional, Tuple, Union
 import xmlschema
+from lxml import etree
 from ossm_models.core.sms_types import Port
 
 
-def validate_with_xsd(xml_path: str, xsd_path: str) -> xmlschema.XMLSchema:
-    schema = xmlschema.XMLSchema(xsd_path)
-    schema.validate(xml_path)
+@functools.lru_cache(maxsize=32)
+def _load_schema(xsd_path: str, mtime: float) -> etree.XMLSchema:
+    return etree.XMLSchema(etree.parse(xsd_path))
+
+
+def compiled_schema(xsd_path: str) -> etree.XMLSchema:
+    """ The compiled lxml schema for the XSD, cached by path and mtime. """
+    return _load_schema(xsd_path, os.path.getmtime(xsd_path))
+
+
+def validate_with_xsd(
+    xml_path: str,
+    xsd_path: str,
+    use_xmlschema: bool = False,
+) -> Union[etree.XMLSchema, xmlschema.XMLSchema]:
+    """ Validate the XML file against the XSD, raising if it is invalid.
+
+    Validation runs through lxml/libxml2; pass `use_xmlschema=True` to use
+    the (much slower) pure-Python xmlschema backend and its richer error
+    objects. Returns the compiled schema of the backend used.
+    """
+    if use_xmlschema:
+        schema = xmlschema.XMLSchema(xsd_path)
+        schema.validate(xml_path)
+        return schema
+
+    schema = compiled_schema(xsd_path)
+    doc = etree.parse(xml_path, etree.XMLParser(resolve_entities=False))
+    schema.assertValid(doc)
     return schema
 
 
+def validate_many(
+    xml_paths: Iterable[str],
+    xsd_path: str,
+    max_workers: Optional[int] = None,
+) -> None:
+    """ Validate many XML files against one XSD concurrently.
+
+    libxml2 releases the GIL while parsing and validating, so a thread
+    pool over the shared compiled schema scales with core count (lxml
+    permits sharing an XMLSchema across threads). Raises on the first
+    invalid document.
+    """
+    schema = compiled_schema(xsd_path)
+
+    def _validate(path: str) -> None:
+        doc = etree.parse(path, etree.XMLParser(resolve_entities=False))
+        schema.assertValid(doc)
+
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as ex:
+        list(ex.map(_validate, xml_paths))
+
+
 def axes(spec: Optional[str]) -> Optional[List[str]]:
     return None if not spec else [a.strip() for a in spec.split(",") if a.strip()]
 
@@ -23,25 +75,58 @@ def dims_map(port: Port) -> Dict[str, Optional[int]]:
             out[d.name] = d.size
     return out
 
+def port_axes(port: Port) -> Tuple[str, ...]:
+    """ The port's axis names as a tuple, precomputed at construction.
+
+    An absent/empty spec yields the empty tuple. Falls back to computing
+    (and caching) for ports deserialized without the precomputed view.
+    """
+    cached = port._axes
+    if cached is None:
+        spec = port.shape.spec if port.shape else None
+        a = axes(spec)
+        cached = port._axes = () if a is None else tuple(a)
+    return cached
+
+def port_dims_map(port: Port) -> Dict[str, Optional[int]]:
+    """ The port's named-dim sizes, precomputed at construction.
+
+    Falls back to computing (and caching) for ports deserialized without
+    the precomputed view.
+    """
+    cached = port._dims_map
+    if cached is None:
+        cached = port._dims_map = dims_map(port)
+    return cached
+
 def ports_compatible(src: Port, dst: Port) -> bool:
+    # shapes are interned flyweights, so the common identical-shape case
+    # (including both None) reduces to a dtype compare
+    if src.shape is dst.shape:
+        return src.dtype == dst.dtype
+
     if src.dtype != dst.dtype:
         return False
 
-
-    a_src = axes(src.shape.spec) if src.shape else None
-    a_dst = axes(dst.shape.spec) if dst.shape else None
-    if a_src is not None and a_dst is not None and a_src != a_dst:
+    # shape specs never change after parsing, so compare the memoized
+    # axis tuples instead of re-splitting the spec strings each call
+    a_src = port_axes(src)
+    a_dst = port_axes(dst)
+    if a_src and a_dst and a_src != a_dst:
         return False
 
     if not src.shape or not dst.shape:
         return True
 
-    dm_s = dims_map(src)
-    dm_d = dims_map(dst)
-    for k in set(dm_s) | set(dm_d):
-        vs, vd = dm_s.get(k), dm_d.get(k)
-        if vs is None or vd is None:
+    # mismatches can only occur where both sides name a dim, so iterate
+    # the key intersection (a single C-level set op, no set() allocation)
+    dm_s = port_dims_map(src)
+    dm_d = port_dims_map(dst)
+    for k in dm_s.keys() & dm_d.keys():
+        vs = dm_s[k]
+        vd = dm_d[k]
+        if vs is None or vd is None or vs == -1 or vd == -1:
             continue
-        if vs != -1 and vd != -1 and vs != vd:
+        if vs != vd:
             return False
     return True